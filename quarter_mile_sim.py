@@ -10,15 +10,41 @@ root so that Pyodide can import it directly.
 
 Only numpy is required at runtime.  No file I/O, no C extensions beyond
 numpy itself – both constraints are required for Pyodide compatibility.
+When numba is installed (regular CPython) the integration loop is
+JIT-compiled; without it the pure-Python solver is used unchanged.
+scipy, if present, enables the optional adaptive RK45 integrator; it is
+imported only when that integrator is requested.
 """
 
+import collections
+import warnings
+
 import numpy as np
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Pyodide / numpy-only installs
+    njit = None
+    HAVE_NUMBA = False
+
+
+def _jit(fn):
+    """Compile *fn* with numba when available, otherwise return it unchanged."""
+    if HAVE_NUMBA:
+        return njit(cache=True, fastmath=True)(fn)
+    return fn
+
+
 # ── Physical constants ────────────────────────────────────────────────────────
 G = 9.81                # gravitational acceleration, m/s²
 RHO_AIR = 1.225         # air density at sea level, kg/m³
 QUARTER_MILE_M = 402.336  # race distance, m
 DEFAULT_DT = 0.01       # default forward-Euler timestep, s
+IVP_MAX_STEP = 0.25     # largest step the adaptive RK45 integrator may take, s
+MAX_SIM_TIME_S = 60.0   # hard stop for a run that never reaches the target, s
+TORQUE_LUT_N = 4096     # samples in the uniform-grid torque lookup table
+SERIES_DTYPE = np.float32  # storage dtype of the returned time-series arrays
 
 # ── Lookup tables ─────────────────────────────────────────────────────────────
 DRIVETRAIN_BASE: dict = {
@@ -48,9 +74,80 @@ def tire_grip_multiplier(tire_width_mm: float, tire_compound: str = "summer") ->
 
 
 def interp_curve(curve_points: list, x_value: float) -> float:
-    """Linear interpolation over a list of [x, y] breakpoints."""
-    points = np.array(curve_points, dtype=float)
-    return float(np.interp(x_value, points[:, 0], points[:, 1]))
+    """
+    Linear interpolation over a list of [x, y] breakpoints.
+
+    .. deprecated::
+        Rebuilds the breakpoint arrays on every call.  Use ``np.interp``
+        with the ``_tc_x`` / ``_tc_y`` arrays that :func:`make_car` caches
+        on the ``ice`` / ``motor`` block instead.
+    """
+    warnings.warn(
+        "interp_curve is deprecated; call np.interp on the _tc_x / _tc_y "
+        "arrays cached by make_car instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    xp, fp = _curve_arrays(curve_points)
+    return float(np.interp(x_value, xp, fp))
+
+
+def _curve_arrays(curve_points: list) -> tuple:
+    """
+    Split a list of [x, y] breakpoints into contiguous float64 ``(xp, fp)``
+    arrays suitable for passing straight to ``np.interp``.
+    """
+    xp = np.asarray([p[0] for p in curve_points], dtype=np.float64)
+    fp = np.asarray([p[1] for p in curve_points], dtype=np.float64)
+    return xp, fp
+
+
+def _curve_lut(xp: np.ndarray, fp: np.ndarray, max_rpm: float) -> tuple:
+    """
+    Resample a torque curve onto a uniform RPM grid for O(1) lookup.
+
+    Returns ``(lut, scale)`` where ``lut[k]`` is the torque at
+    ``k / scale`` RPM.  ``max_rpm`` maps to index ``TORQUE_LUT_N - 2`` so the
+    upper neighbour used by :func:`_lut_interp` always exists.
+    """
+    scale = (TORQUE_LUT_N - 2) / max_rpm
+    lut = np.interp(np.arange(TORQUE_LUT_N) / scale, xp, fp)
+    return lut, scale
+
+
+@_jit
+def _lut_interp(rpm, lut, scale):
+    """Linear interpolation into a table built by :func:`_curve_lut`; ``0 <= rpm <= max_rpm``."""
+    k = rpm * scale
+    i = int(k)
+    f = k - i
+    return lut[i] + f * (lut[i + 1] - lut[i])
+
+
+def _add_curve_tables(block: dict, max_rpm: float) -> None:
+    """Cache the torque curve of an ``ice`` / ``motor`` block as breakpoint arrays and a LUT."""
+    block["_tc_x"], block["_tc_y"] = _curve_arrays(block["torque_curve_rpm_nm"])
+    block["_tc_lut"], block["_tc_scale"] = _curve_lut(block["_tc_x"], block["_tc_y"], max_rpm)
+
+
+def _add_derived_fields(car: dict) -> None:
+    """
+    Precompute the per-car constants the solvers use every step:
+    the guarded inverse wheel radius, the speed → engine/motor RPM factor of
+    each gear, and the torque-curve tables.
+    """
+    car["_inv_wheel_r"] = 1.0 / max(car["wheel_radius_m"], 0.2)
+    wheel_rpm_per_mps = car["_inv_wheel_r"] * 60.0 / (2.0 * np.pi)
+    if "ice" in car:
+        ice = car["ice"]
+        ice["_erpm_per_mps"] = np.array(
+            [wheel_rpm_per_mps * ratio * ice["final_drive"] for ratio in ice["gear_ratios"]]
+        )
+        _add_curve_tables(ice, ice["redline_rpm"])
+    if "motor" in car:
+        motor = car["motor"]
+        motor["_rpm_per_mps"] = wheel_rpm_per_mps * motor["single_speed_ratio"]
+        _add_curve_tables(motor, motor["max_rpm"])
 
 
 # ── Kinematics helpers ────────────────────────────────────────────────────────
@@ -60,13 +157,6 @@ def wheel_rpm_from_speed(v: float, wheel_radius_m: float) -> float:
     return (v / max(wheel_radius_m, 0.2)) * 60.0 / (2.0 * np.pi)
 
 
-def get_gear_ratio(car: dict, gear_index: int) -> float:
-    """Look up the transmission ratio for the given gear (0-indexed), clamped to valid range."""
-    ratios = car["ice"]["gear_ratios"]
-    idx = int(np.clip(gear_index, 0, len(ratios) - 1))
-    return ratios[idx]
-
-
 # ── Schema → runtime adapter ──────────────────────────────────────────────────
 
 def make_car(name: str, spec: dict) -> dict:
@@ -86,6 +176,13 @@ def make_car(name: str, spec: dict) -> dict:
     -------
     dict
         Flat runtime representation ready for ``simulate_quarter_mile``.
+        Derived per-car constants are cached alongside: ``_inv_wheel_r``
+        (``1 / max(wheel_radius_m, 0.2)``) and, in the ``ice`` / ``motor``
+        block, the RPM per m/s of road speed (``_erpm_per_mps`` per gear /
+        ``_rpm_per_mps``) and the torque curve as float64 breakpoint arrays (``_tc_x``,
+        ``_tc_y``) and as a uniform-grid lookup table (``_tc_lut``,
+        ``_tc_scale``) spanning 0 to the redline / max RPM, so the solver
+        never rebuilds or searches the curve inside the integration loop.
     """
     vehicle = spec["vehicle"]
     tire = vehicle["tire"]
@@ -138,123 +235,530 @@ def make_car(name: str, spec: dict) -> dict:
             "torque_curve_rpm_nm": motor["torque_curve_rpm_nm"],
         }
 
+    _add_derived_fields(car)
     return car
 
 
-# ── Simulation state ──────────────────────────────────────────────────────────
+# ── Pure-Python integration loop ──────────────────────────────────────────────
+
+def _simulate_python(car: dict, dt: float, distance_target: float) -> dict:
+    """
+    Pure-Python forward-Euler loop – the reference step physics.
+
+    Each step looks up engine/motor torque at the current RPM (held at zero
+    drive force during a manual shift window), caps the wheel force at the
+    traction limit, subtracts aero drag and rolling resistance, and
+    schedules an upshift once the RPM reaches ``shift_rpm``.  Car parameters
+    and shift state live in locals, so a step does no dict lookups or
+    mutations.  A BEV is unpacked as a single-gear ICE exactly as for
+    ``_simulate_kernel``; other powertrain types produce no drive force.
+    """
+    t, x, v = 0.0, 0.0, 0.0
+    gear_index = 0
+    in_shift = False
+    shift_timer_s = 0.0
+    pending_gear_index = 0
+    shift_count = 0
+    rpm = 0.0
+
+    # Per-run constants, hoisted out of the loop.
+    traction_force_max = car["mu"] * car["mass"] * G * car["drive_factor"]
+    rolling_force = car["rolling_resistance"] * car["mass"] * G
+    aero_k = 0.5 * RHO_AIR * car["CdA"]
+    inv_mass = 1.0 / car["mass"]
+    inv_r = car["_inv_wheel_r"]
+
+    has_drive = car["powertrain_type"] in ("ICE", "BEV")
+    is_ice = car["powertrain_type"] == "ICE"
+    if has_drive:
+        (_, _, _, _, _, _,
+         ratios, erpm_per_mps, final_drive, launch_rpm, idle_rpm, redline_rpm,
+         shift_rpm, shift_time_s, is_manual, eng_eff, dl_eff,
+         tc_lut, tc_scale, is_ice) = _kernel_args(car)
+        # Lists index to Python floats, which are much cheaper per step than
+        # numpy scalars.
+        ratios, erpm_per_mps, tc_lut = ratios.tolist(), erpm_per_mps.tolist(), tc_lut.tolist()
+        last_gear = len(ratios) - 1
+
+    # Preallocate every output channel for the worst case (60 s cap plus
+    # float round-off on the accumulated time) and truncate on return.
+    # The state itself stays float64; only the stored samples are narrowed.
+    n_max = int(MAX_SIM_TIME_S / dt) + 3
+    times         = np.empty(n_max, dtype=SERIES_DTYPE)
+    distances     = np.empty(n_max, dtype=SERIES_DTYPE)
+    speeds        = np.empty(n_max, dtype=SERIES_DTYPE)
+    accels        = np.empty(n_max, dtype=SERIES_DTYPE)
+    gears         = np.empty(n_max, dtype=np.int64)
+    rpms          = np.empty(n_max, dtype=SERIES_DTYPE)
+    wheel_torques = np.empty(n_max, dtype=SERIES_DTYPE)
+
+    i = 0
+    times[0] = distances[0] = speeds[0] = accels[0] = 0.0
+    rpms[0] = wheel_torques[0] = 0.0
+    gears[0] = gear_index + 1
+
+    while x < distance_target and t <= MAX_SIM_TIME_S:
+        if not has_drive:
+            drive_force = wheel_torque = 0.0
+        elif in_shift:
+            shift_timer_s -= dt
+            if shift_timer_s <= 0.0:
+                in_shift = False
+                gear_index = pending_gear_index
+            drive_force = wheel_torque = 0.0
+        else:
+            floor_rpm = launch_rpm if v < 1.5 else idle_rpm
+            rpm = min(max(v * erpm_per_mps[gear_index], floor_rpm), redline_rpm)
+            # _lut_interp, inlined
+            k = rpm * tc_scale
+            j = int(k)
+            lo = tc_lut[j]
+            torque = lo + (k - j) * (tc_lut[j + 1] - lo)
+            wheel_torque = torque * ratios[gear_index] * final_drive * eng_eff * dl_eff
+            drive_force = wheel_torque * inv_r
+            if gear_index < last_gear and rpm >= shift_rpm:
+                pending_gear_index = gear_index + 1
+                shift_count += 1
+                if is_manual:
+                    in_shift = True
+                    shift_timer_s = shift_time_s
+                else:
+                    gear_index = pending_gear_index
+
+        usable_force = min(drive_force, traction_force_max)
+        a = (usable_force - aero_k * v * v - rolling_force) * inv_mass
+
+        v = max(0.0, v + a * dt)
+        x = x + v * dt
+        t = t + dt
 
-def initialize_state(car: dict) -> dict:
-    """Return a fresh per-run mutable state dict for the given car."""
+        i += 1
+        times[i] = t
+        distances[i] = x
+        speeds[i] = v
+        accels[i] = a
+        gears[i] = gear_index + 1
+        rpms[i] = rpm
+        wheel_torques[i] = wheel_torque
+
+    n = i + 1
+    zeros = np.zeros(n, dtype=SERIES_DTYPE)
     return {
-        "gear_index": 0,
-        "in_shift": False,
-        "shift_timer_s": 0.0,
-        "pending_gear_index": 0,
-        "shift_count": 0,
-        "engine_rpm": 0.0,
-        "motor_rpm": 0.0,
+        "time":         times[:n],
+        "distance":     distances[:n],
+        "speed":        speeds[:n],
+        "accel":        accels[:n],
+        "gear":         gears[:n],
+        "engine_rpm":   rpms[:n] if is_ice else zeros,
+        "motor_rpm":    zeros if is_ice else rpms[:n],
+        "wheel_torque": wheel_torques[:n],
+        "elapsed_time": t,
+        "trap_speed":   v,
+        "shift_count":  shift_count,
     }
 
 
-# ── Drivetrain force helpers ──────────────────────────────────────────────────
+# ── JIT integration kernel ────────────────────────────────────────────────────
 
-def ice_drive_force(v: float, car: dict, state: dict) -> float:
+@_jit
+def _simulate_kernel(
+    mass, CdA, mu, drive_factor, rolling_resistance, wheel_radius,
+    ratios, erpm_per_mps, final_drive, launch_rpm, idle_rpm, redline_rpm,
+    shift_rpm, shift_time_s, gearbox_is_manual, eng_eff, dl_eff,
+    tc_lut, tc_scale, is_ice, dt, distance_target,
+):
     """
-    Compute instantaneous wheel force (N) for an ICE powertrain.
+    Pure-numeric forward-Euler loop mirroring :func:`_simulate_python`.
+
+    A BEV is expressed as a single-gear ICE with ``final_drive=1``, zero
+    idle/launch floor and ``redline_rpm=max_rpm``; ``is_ice`` only selects
+    which RPM channel is written.  ``erpm_per_mps[g]`` is the cached
+    ``_erpm_per_mps`` factor mapping road speed to RPM in gear ``g``.
 
-    Side-effect: updates ``state["engine_rpm"]``.
+    Returns the preallocated ``SERIES_DTYPE`` time-series arrays, the
+    number of valid samples, and the final float64 ``(t, v, shift_count)``.
     """
-    ice = car["ice"]
-    ratio = get_gear_ratio(car, state["gear_index"])
-    fd = ice["final_drive"]
-    engine_rpm = wheel_rpm_from_speed(v, car["wheel_radius_m"]) * ratio * fd
-    if v < 1.5:
-        engine_rpm = max(engine_rpm, ice["launch_rpm"])
-    else:
-        engine_rpm = max(engine_rpm, ice["idle_rpm"])
-    engine_rpm = min(engine_rpm, ice["redline_rpm"])
-    state["engine_rpm"] = engine_rpm
-    engine_torque = interp_curve(ice["torque_curve_rpm_nm"], engine_rpm)
-    wheel_torque = (
-        engine_torque * ratio * fd
-        * ice["engine_efficiency"]
-        * ice["driveline_efficiency"]
-    )
-    return wheel_torque / max(car["wheel_radius_m"], 0.2)
+    n_max = int(MAX_SIM_TIME_S / dt) + 3
+    times = np.empty(n_max, dtype=SERIES_DTYPE)
+    distances = np.empty(n_max, dtype=SERIES_DTYPE)
+    speeds = np.empty(n_max, dtype=SERIES_DTYPE)
+    accels = np.empty(n_max, dtype=SERIES_DTYPE)
+    gears = np.empty(n_max, dtype=np.int64)
+    engine_rpms = np.empty(n_max, dtype=SERIES_DTYPE)
+    motor_rpms = np.empty(n_max, dtype=SERIES_DTYPE)
+    wheel_torques = np.empty(n_max, dtype=SERIES_DTYPE)
+
+    # Loop invariants
+    traction_force_max = mu * mass * G * drive_factor
+    rolling_force = rolling_resistance * mass * G
+    aero_k = 0.5 * RHO_AIR * CdA
+    inv_mass = 1.0 / mass
+    inv_r = 1.0 / max(wheel_radius, 0.2)
+
+    n_gears = ratios.shape[0]
+    gear_index = 0
+    in_shift = False
+    shift_timer_s = 0.0
+    pending_gear_index = 0
+    shift_count = 0
+    rpm = 0.0
 
+    t, x, v = 0.0, 0.0, 0.0
+    i = 0
+    times[0] = distances[0] = speeds[0] = accels[0] = 0.0
+    engine_rpms[0] = motor_rpms[0] = wheel_torques[0] = 0.0
+    gears[0] = 1
+
+    while x < distance_target and t <= MAX_SIM_TIME_S:
+        if in_shift:
+            shift_timer_s -= dt
+            if shift_timer_s <= 0.0:
+                in_shift = False
+                gear_index = pending_gear_index
+            drive_force = 0.0
+            wheel_torque = 0.0
+        else:
+            ratio = ratios[gear_index]
+            # Fused clamp; compiles to branch-free maxsd/minsd.
+            floor_rpm = launch_rpm if v < 1.5 else idle_rpm
+            rpm = min(max(v * erpm_per_mps[gear_index], floor_rpm), redline_rpm)
+            torque = _lut_interp(rpm, tc_lut, tc_scale)
+            wheel_torque = torque * ratio * final_drive * eng_eff * dl_eff
+            drive_force = wheel_torque * inv_r
+            if gear_index < n_gears - 1 and rpm >= shift_rpm:
+                pending_gear_index = gear_index + 1
+                shift_count += 1
+                if gearbox_is_manual:
+                    in_shift = True
+                    shift_timer_s = shift_time_s
+                else:
+                    gear_index = pending_gear_index
+
+        usable_force = min(drive_force, traction_force_max)
+        a = (usable_force - aero_k * v * v - rolling_force) * inv_mass
 
-def motor_drive_force(v: float, car: dict, state: dict) -> float:
-    """
-    Compute instantaneous wheel force (N) for a BEV powertrain.
+        v = max(0.0, v + a * dt)
+        x = x + v * dt
+        t = t + dt
 
-    Side-effect: updates ``state["motor_rpm"]``.
-    """
+        i += 1
+        times[i] = t
+        distances[i] = x
+        speeds[i] = v
+        accels[i] = a
+        gears[i] = gear_index + 1
+        if is_ice:
+            engine_rpms[i] = rpm
+            motor_rpms[i] = 0.0
+        else:
+            engine_rpms[i] = 0.0
+            motor_rpms[i] = rpm
+        wheel_torques[i] = wheel_torque
+
+    return (
+        times, distances, speeds, accels, gears,
+        engine_rpms, motor_rpms, wheel_torques,
+        i + 1, t, v, shift_count,
+    )
+
+
+def _kernel_args(car: dict) -> tuple:
+    """Unpack a runtime car dict into the positional arguments of ``_simulate_kernel``."""
+    head = (
+        car["mass"], car["CdA"], car["mu"], car["drive_factor"],
+        car["rolling_resistance"], car["wheel_radius_m"],
+    )
+    if car["powertrain_type"] == "ICE":
+        ice = car["ice"]
+        return head + (
+            np.asarray(ice["gear_ratios"], dtype=np.float64), ice["_erpm_per_mps"],
+            ice["final_drive"], ice["launch_rpm"], ice["idle_rpm"],
+            ice["redline_rpm"], ice["shift_rpm"], ice["shift_time_s"],
+            ice["gearbox_type"] == "manual",
+            ice["engine_efficiency"], ice["driveline_efficiency"],
+            ice["_tc_lut"], ice["_tc_scale"], True,
+        )
     motor = car["motor"]
-    ratio = motor["single_speed_ratio"]
-    motor_rpm = wheel_rpm_from_speed(v, car["wheel_radius_m"]) * ratio
-    motor_rpm = min(motor_rpm, motor["max_rpm"])
-    state["motor_rpm"] = motor_rpm
-    motor_torque = interp_curve(motor["torque_curve_rpm_nm"], motor_rpm)
-    wheel_torque = (
-        motor_torque * ratio
-        * motor["motor_efficiency"]
-        * motor["inverter_efficiency"]
+    return head + (
+        np.array([motor["single_speed_ratio"]]), np.array([motor["_rpm_per_mps"]]),
+        1.0, 0.0, 0.0, motor["max_rpm"], motor["max_rpm"], 0.0, False,
+        motor["motor_efficiency"], motor["inverter_efficiency"],
+        motor["_tc_lut"], motor["_tc_scale"], False,
     )
-    return wheel_torque / max(car["wheel_radius_m"], 0.2)
-
-
-def _maybe_schedule_shift(v: float, car: dict, state: dict) -> None:
-    """Trigger an upshift when the engine hits shift_rpm."""
-    if "ice" not in car:
-        return
-    ice = car["ice"]
-    ratios = ice["gear_ratios"]
-    if state["in_shift"] or state["gear_index"] >= len(ratios) - 1:
-        return
-    if state["engine_rpm"] >= ice["shift_rpm"]:
-        state["pending_gear_index"] = state["gear_index"] + 1
-        if ice["gearbox_type"] == "manual":
-            state["in_shift"] = True
-            state["shift_timer_s"] = ice["shift_time_s"]
-            state["shift_count"] += 1
-        else:
-            state["gear_index"] = state["pending_gear_index"]
-            state["shift_count"] += 1
 
 
-def propulsion_force(v: float, car: dict, state: dict, dt_step: float) -> float:
-    """
-    Return net propulsion force (N) for the current timestep.
+def _simulate_jit(car: dict, dt: float, distance_target: float) -> dict:
+    """Run ``_simulate_kernel`` for *car* and package the result like the Python path."""
+    (times, distances, speeds, accels, gears,
+     engine_rpms, motor_rpms, wheel_torques,
+     n, t, v, shift_count) = _simulate_kernel(
+        *_kernel_args(car), float(dt), float(distance_target)
+    )
+    return {
+        "time":         times[:n],
+        "distance":     distances[:n],
+        "speed":        speeds[:n],
+        "accel":        accels[:n],
+        "gear":         gears[:n],
+        "engine_rpm":   engine_rpms[:n],
+        "motor_rpm":    motor_rpms[:n],
+        "wheel_torque": wheel_torques[:n],
+        "elapsed_time": float(t),
+        "trap_speed":   float(v),
+        "shift_count":  int(shift_count),
+    }
+
+
+if HAVE_NUMBA:
+    # Compile (or load from cache) at import so the first race isn't slowed
+    # down by JIT compilation.  The arguments match the real call signature.
+    _simulate_kernel(
+        1000.0, 0.6, 1.0, 1.0, 0.015, 0.3, np.array([3.0, 2.0]),
+        np.array([1000.0, 700.0]), 3.5, 1000.0, 800.0, 7000.0, 6500.0, 0.3, True, 0.9, 0.9,
+        np.full(TORQUE_LUT_N, 300.0), (TORQUE_LUT_N - 2) / 7000.0, True,
+        MAX_SIM_TIME_S / 2.0, 1e-9,
+    )
 
-    Handles the zero-power shift window for manual gearboxes.
-    """
-    if car["powertrain_type"] == "ICE":
-        if state["in_shift"]:
-            state["shift_timer_s"] -= dt_step
-            if state["shift_timer_s"] <= 0.0:
-                state["in_shift"] = False
-                state["gear_index"] = state["pending_gear_index"]
-            return 0.0
-        force = ice_drive_force(v, car, state)
-        _maybe_schedule_shift(v, car, state)
-        return force
-    if car["powertrain_type"] == "BEV":
-        return motor_drive_force(v, car, state)
-    return 0.0
 
+# ── Adaptive RK45 integrator ──────────────────────────────────────────────────
 
-def acceleration_and_state(v: float, car: dict, state: dict, dt_step: float) -> float:
+def _simulate_ivp(car: dict, dt: float, distance_target: float) -> dict:
     """
-    Compute net longitudinal acceleration (m/s²), accounting for traction limit,
-    aerodynamic drag, and rolling resistance.
+    Adaptive RK45 integration of ``[x, v]`` with ``scipy.integrate.solve_ivp``.
+
+    The run is split into segments of constant drivetrain mode – a gear, or
+    a manual shift window with zero drive force.  Upshifts and the finish
+    line are located with terminal events, so ``elapsed_time`` and
+    ``trap_speed`` are the exact crossing values, and each segment's dense
+    output is resampled onto the uniform ``dt`` grid for the time series.
+
+    scipy is imported here rather than at module level so that only callers
+    of ``method="rk45"`` pay for it; raises ``ImportError`` without scipy.
     """
-    drive_force = propulsion_force(v, car, state, dt_step)
-    traction_force_max = car["mu"] * car["mass"] * G * car["drive_factor"]
-    usable_force = min(drive_force, traction_force_max)
-    drag_force = 0.5 * RHO_AIR * car["CdA"] * v ** 2
-    rolling_force = car["rolling_resistance"] * car["mass"] * G
-    net_force = usable_force - drag_force - rolling_force
-    return net_force / car["mass"]
+    from scipy.integrate import solve_ivp
+
+    (mass, CdA, mu, drive_factor, rolling_resistance, wheel_radius,
+     ratios, erpm_per_mps, final_drive, launch_rpm, idle_rpm, redline_rpm,
+     shift_rpm, shift_time_s, is_manual, eng_eff, dl_eff,
+     _, _, is_ice) = _kernel_args(car)
+    block = car["ice"] if is_ice else car["motor"]
+    tc_x, tc_y = block["_tc_x"], block["_tc_y"]
+
+    traction_force_max = mu * mass * G * drive_factor
+    rolling_force = rolling_resistance * mass * G
+    aero_k = 0.5 * RHO_AIR * CdA
+    inv_mass = 1.0 / mass
+    inv_r = car["_inv_wheel_r"]
+    torque_gain = final_drive * eng_eff * dl_eff
+    n_gears = len(ratios)
+
+    # Scalar/array-agnostic versions of the Euler step's RPM and force terms for a fixed gear.
+    def unclamped_rpm(v, gear):
+        return np.maximum(v * erpm_per_mps[gear], np.where(v < 1.5, launch_rpm, idle_rpm))
+
+    def drive_rpm(v, gear):
+        return np.minimum(unclamped_rpm(v, gear), redline_rpm)
+
+    def wheel_torque(rpm, gear):
+        return np.interp(rpm, tc_x, tc_y) * ratios[gear] * torque_gain
+
+    def accel(v, torque):
+        return (np.minimum(torque * inv_r, traction_force_max)
+                - aero_k * v * v - rolling_force) * inv_mass
+
+    def rhs(t, y, gear, shifting):
+        v = max(y[1], 0.0)
+        a = float(accel(v, 0.0 if shifting else wheel_torque(drive_rpm(v, gear), gear)))
+        return [v, a if v > 0.0 or a > 0.0 else 0.0]
+
+    def finish(t, y, gear, shifting):
+        return y[0] - distance_target
+    finish.terminal, finish.direction = True, 1
+
+    # Uses the RPM before the redline clamp: for shift_rpm <= redline_rpm it
+    # crosses zero exactly where the Euler loop's ``rpm >= shift_rpm`` turns
+    # true, whereas the clamped RPM would sit flat at zero when the two are
+    # equal and let the solver place the shift up to a whole step late.
+    def upshift(t, y, gear, shifting):
+        return float(unclamped_rpm(y[1], gear)) - shift_rpm
+    upshift.terminal, upshift.direction = True, 1
+
+    def run(t0, t1, y0, gear, shifting, events):
+        sol = solve_ivp(
+            rhs, (t0, t1), y0, method="RK45", args=(gear, shifting),
+            events=events, max_step=IVP_MAX_STEP, rtol=1e-5, atol=1e-8,
+            dense_output=True,
+        )
+        if sol.status < 0:
+            raise RuntimeError(f"RK45 integration failed at t={sol.t[-1]:.3f} s: {sol.message}")
+        segments.append((sol.t[-1], sol.sol, gear, shifting, y0[1]))
+        crossed = bool(sol.t_events[0].size)
+        shifted = len(events) > 1 and bool(sol.t_events[1].size)
+        return sol.t[-1], sol.y[:, -1], crossed, shifted
+
+    segments = []  # (t_end, dense_solution, gear_index, in_shift, v_start)
+    t, y = 0.0, np.zeros(2)
+    gear_index, shift_count = 0, 0
+    crossed = distance_target <= 0.0
+    while not crossed and t < MAX_SIM_TIME_S:
+        # A shift point above redline is never reached, as in the Euler loop.
+        can_shift = is_ice and gear_index < n_gears - 1 and shift_rpm <= redline_rpm
+        if can_shift and unclamped_rpm(y[1], gear_index) >= shift_rpm:
+            shifted = True
+        else:
+            events = [finish, upshift] if can_shift else [finish]
+            t, y, crossed, shifted = run(t, MAX_SIM_TIME_S, y, gear_index, False, events)
+        if crossed or not shifted:
+            break
+        shift_count += 1
+        if is_manual:
+            t_shift_end = min(t + shift_time_s, MAX_SIM_TIME_S)
+            t, y, crossed, _ = run(t, t_shift_end, y, gear_index, True, [finish])
+        gear_index += 1
+
+    # Resample every segment onto the uniform output grid (plus the exact end).
+    times = np.append(np.arange(0.0, t, dt), t)
+    distances = np.zeros_like(times)
+    speeds = np.zeros_like(times)
+    accels = np.zeros_like(times)
+    gears = np.ones(times.shape, dtype=np.int64)
+    rpms = np.zeros_like(times)
+    wheel_torques = np.zeros_like(times)
+    start = 0
+    for t_end, dense, gear, shifting, v_start in segments:
+        stop = np.searchsorted(times, t_end, side="right")
+        ts = times[start:stop]
+        xs, vs = dense(ts)
+        vs = np.maximum(vs, 0.0)
+        # RPM is held at its pre-shift value during a manual shift window.
+        rpm = drive_rpm(v_start if shifting else vs, gear)
+        torque = np.zeros_like(vs) if shifting else wheel_torque(rpm, gear)
+        distances[start:stop] = xs
+        speeds[start:stop] = vs
+        accels[start:stop] = accel(vs, torque)
+        gears[start:stop] = gear + 1
+        rpms[start:stop] = rpm
+        wheel_torques[start:stop] = torque
+        start = stop
+
+    zeros = np.zeros(times.shape, dtype=SERIES_DTYPE)
+    return {
+        "time":         times.astype(SERIES_DTYPE),
+        "distance":     distances.astype(SERIES_DTYPE),
+        "speed":        speeds.astype(SERIES_DTYPE),
+        "accel":        accels.astype(SERIES_DTYPE),
+        "gear":         gears,
+        "engine_rpm":   rpms.astype(SERIES_DTYPE) if is_ice else zeros,
+        "motor_rpm":    zeros if is_ice else rpms.astype(SERIES_DTYPE),
+        "wheel_torque": wheel_torques.astype(SERIES_DTYPE),
+        "elapsed_time": float(t),
+        "trap_speed":   float(y[1]),
+        "shift_count":  shift_count,
+    }
+
+
+# ── Result cache ──────────────────────────────────────────────────────────────
+
+# Everything the solver reads from a runtime car dict.  Display-only fields
+# (name, drivetrain label, tyre width/compound) are folded into ``mu`` and
+# ``drive_factor`` already and don't take part in the key.
+_CAR_KEY_FIELDS = (
+    "powertrain_type", "mass", "CdA", "mu", "drive_factor",
+    "wheel_radius_m", "rolling_resistance",
+)
+_BLOCK_KEY_FIELDS = {
+    "ice": (
+        "gearbox_type", "gear_ratios", "final_drive", "idle_rpm", "launch_rpm",
+        "shift_rpm", "redline_rpm", "shift_time_s", "engine_efficiency",
+        "driveline_efficiency", "torque_curve_rpm_nm",
+    ),
+    "motor": (
+        "single_speed_ratio", "max_rpm", "motor_efficiency",
+        "inverter_efficiency", "torque_curve_rpm_nm",
+    ),
+}
+
+
+def _freeze(value):
+    """Turn nested lists / arrays (gear ratios, torque curves) into hashable tuples."""
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _car_key(car: dict) -> tuple:
+    """Hashable key covering every runtime car field that affects the simulation."""
+    key = tuple(car[f] for f in _CAR_KEY_FIELDS)
+    for block_name, fields in _BLOCK_KEY_FIELDS.items():
+        if block_name in car:
+            return key + (block_name, tuple(_freeze(car[block_name][f]) for f in fields))
+    return key + (None, ())
+
+
+def _car_from_key(key: tuple) -> dict:
+    """Rebuild a minimal runtime car dict (including derived fields) from ``_car_key``."""
+    *values, block_name, block_values = key
+    car = dict(zip(_CAR_KEY_FIELDS, values))
+    if block_name is not None:
+        car[block_name] = dict(zip(_BLOCK_KEY_FIELDS[block_name], block_values))
+    _add_derived_fields(car)
+    return car
+
+
+_CACHE_MAXSIZE = 64
+_result_cache: collections.OrderedDict = collections.OrderedDict()
+
+
+def _solve(car: dict, dt: float, distance_target: float, method: str) -> dict:
+    """Run the solver that fits *method* and the current install on *car*."""
+    supported = car["powertrain_type"] in ("ICE", "BEV")
+    if method == "rk45" and supported:
+        try:
+            return _simulate_ivp(car, dt, distance_target)
+        except ImportError:  # no scipy (e.g. Pyodide): fall back to Euler
+            pass
+    if HAVE_NUMBA and supported:
+        return _simulate_jit(car, dt, distance_target)
+    return _simulate_python(car, dt, distance_target)
+
+
+def _cache_lookup(cache_key: tuple):
+    """Return the memoised result for *cache_key*, or ``None``; a hit becomes most recent."""
+    result = _result_cache.get(cache_key)
+    if result is not None:
+        _result_cache.move_to_end(cache_key)
+    return result
+
+
+def _cache_store(cache_key: tuple, result: dict) -> dict:
+    """Memoise *result* under *cache_key*, evicting the least recently used entry."""
+    # The solvers return [:n] views of worst-case (MAX_SIM_TIME_S) buffers;
+    # cache compact copies so an entry doesn't pin the whole allocation.
+    for name, value in result.items():
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+            value.flags.writeable = False
+            result[name] = value
+    _result_cache[cache_key] = result
+    if len(_result_cache) > _CACHE_MAXSIZE:
+        _result_cache.popitem(last=False)
+    return result
+
+
+def _simulate_cached(key: tuple, dt: float, distance_target: float, method: str) -> dict:
+    """Run the solver for the car described by *key*; results are memoised (LRU)."""
+    cache_key = (key, dt, distance_target, method)
+    result = _cache_lookup(cache_key)
+    if result is None:
+        result = _cache_store(cache_key, _solve(_car_from_key(key), dt, distance_target, method))
+    return result
+
+
+def clear_simulation_cache() -> None:
+    """Forget all memoised :func:`simulate_quarter_mile` results."""
+    _result_cache.clear()
 
 
 # ── Main simulation entry point ───────────────────────────────────────────────
@@ -263,10 +767,11 @@ def simulate_quarter_mile(
     car: dict,
     dt: float = DEFAULT_DT,
     distance_target: float = QUARTER_MILE_M,
+    method: str = "euler",
 ) -> dict:
     """
-    Forward-Euler integration from standstill until the car covers
-    ``distance_target`` metres or 60 seconds have elapsed.
+    Integrate from standstill until the car covers ``distance_target``
+    metres or ``MAX_SIM_TIME_S`` seconds have elapsed.
 
     Parameters
     ----------
@@ -276,6 +781,11 @@ def simulate_quarter_mile(
         Integration timestep in seconds (default ``DEFAULT_DT``).
     distance_target : float
         Race distance in metres (default ``QUARTER_MILE_M``).
+    method : str
+        ``"euler"`` (default) for fixed-step forward Euler, or ``"rk45"``
+        for adaptive Runge–Kutta via scipy.  RK45 locates shifts and the
+        finish line exactly and resamples onto the ``dt`` grid; it falls
+        back to Euler when scipy is not installed.
 
     Returns
     -------
@@ -284,68 +794,219 @@ def simulate_quarter_mile(
         ``gear``, ``engine_rpm``, ``motor_rpm``, ``wheel_torque``) plus
         scalar summary fields (``elapsed_time``, ``trap_speed``,
         ``shift_count``).
+
+    Notes
+    -----
+    For Euler, when numba is available ICE/BEV cars run through the
+    compiled ``_simulate_kernel``; otherwise the pure-Python loop is used.
+
+    Results are memoised on the car's physical parameters together with
+    ``dt`` and ``distance_target`` (see :func:`clear_simulation_cache`), so
+    re-running an unchanged car is free.  The returned dict is a fresh
+    copy, but its arrays are shared with the cache and read-only.
     """
-    t, x, v = 0.0, 0.0, 0.0
-    state = initialize_state(car)
-
-    times:        list = [t]
-    distances:    list = [x]
-    speeds:       list = [v]
-    accels:       list = [0.0]
-    gears:        list = [state["gear_index"] + 1]
-    engine_rpms:  list = [0.0]
-    motor_rpms:   list = [0.0]
-    wheel_torques: list = [0.0]
-
-    while x < distance_target and t <= 60.0:
-        a = acceleration_and_state(v, car, state, dt)
-
-        # Record wheel torque at current state (before advancing v)
-        if car["powertrain_type"] == "ICE":
-            ice = car["ice"]
-            ratio = get_gear_ratio(car, state["gear_index"])
-            fd = ice["final_drive"]
-            engine_torque = interp_curve(ice["torque_curve_rpm_nm"], state["engine_rpm"])
-            wheel_torque = (
-                engine_torque * ratio * fd
-                * ice["engine_efficiency"]
-                * ice["driveline_efficiency"]
-            )
-        elif car["powertrain_type"] == "BEV":
-            motor = car["motor"]
-            ratio = motor["single_speed_ratio"]
-            motor_torque = interp_curve(motor["torque_curve_rpm_nm"], state["motor_rpm"])
-            wheel_torque = (
-                motor_torque * ratio
-                * motor["motor_efficiency"]
-                * motor["inverter_efficiency"]
-            )
-        else:
-            wheel_torque = 0.0
+    if method not in ("euler", "rk45"):
+        raise ValueError(f"unknown integration method {method!r}; expected 'euler' or 'rk45'")
+    return dict(_simulate_cached(_car_key(car), float(dt), float(distance_target), method))
 
-        v = max(0.0, v + a * dt)
+
+# ── Batch simulation ──────────────────────────────────────────────────────────
+
+def simulate_quarter_mile_batch(
+    cars: list,
+    dt: float = DEFAULT_DT,
+    distance_target: float = QUARTER_MILE_M,
+) -> list:
+    """
+    Race several ICE/BEV cars side by side in one structure-of-arrays sweep.
+
+    Equivalent to ``[simulate_quarter_mile(c, dt, distance_target) for c in
+    cars]``, but without numba every car's state is advanced together as
+    NumPy vectors, so the interpreter overhead is paid once per timestep
+    instead of once per car and timestep.  With numba the per-car compiled
+    kernel is faster than any vectorised sweep and is used instead; the
+    per-car path is also taken whenever a car is neither ICE nor BEV, since
+    the sweep only models those two powertrains.
+
+    Either way results share the :func:`simulate_quarter_mile` memo: cars
+    already simulated with the same ``dt`` and ``distance_target`` are not
+    swept again, swept results are stored for later calls, and every
+    returned array is a compact read-only copy.
+
+    Parameters
+    ----------
+    cars : list[dict]
+        Runtime car dicts produced by :func:`make_car`.
+    dt : float
+        Integration timestep in seconds (default ``DEFAULT_DT``).
+    distance_target : float
+        Race distance in metres (default ``QUARTER_MILE_M``).
+
+    Returns
+    -------
+    list[dict]
+        One result dict per car, in input order, with the same keys as
+        :func:`simulate_quarter_mile`.
+    """
+    vectorisable = all(car["powertrain_type"] in ("ICE", "BEV") for car in cars)
+    if HAVE_NUMBA or not cars or not vectorisable:
+        return [simulate_quarter_mile(car, dt, distance_target) for car in cars]
+
+    dt, distance_target = float(dt), float(distance_target)
+    cache_keys = [(_car_key(car), dt, distance_target, "euler") for car in cars]
+    results = [_cache_lookup(cache_key) for cache_key in cache_keys]
+    misses = [c for c, result in enumerate(results) if result is None]
+    if misses:
+        swept = _simulate_sweep([cars[c] for c in misses], dt, distance_target)
+        for c, result in zip(misses, swept):
+            results[c] = _cache_store(cache_keys[c], result)
+    return [dict(result) for result in results]
+
+
+def _simulate_sweep(cars: list, dt: float, distance_target: float) -> list:
+    """Vectorised forward-Euler sweep behind :func:`simulate_quarter_mile_batch`."""
+    # Same unpacking as the JIT kernel: scalar columns become per-car
+    # arrays, array columns (gear ratios, torque LUTs) stay as tuples.
+    (mass, CdA, mu, drive_factor, rolling_resistance, wheel_radius,
+     ratio_rows, erpm_rows, final_drive, launch_rpm, idle_rpm, redline_rpm,
+     shift_rpm, shift_time_s, is_manual, eng_eff, dl_eff,
+     luts, scale, is_ice) = (
+        np.array(col) if np.ndim(col[0]) == 0 else col
+        for col in zip(*(_kernel_args(car) for car in cars))
+    )
+
+    n_cars = len(cars)
+    lut = np.stack(luts)
+    n_gears = np.array([len(r) for r in ratio_rows])
+    # Per-gear tables padded with the top gear, flattened so per-step gathers
+    # are a single 1-D take at ``gear_base + gear_index``.
+    ratios = np.empty((n_cars, n_gears.max()))
+    erpm_per_mps = np.empty_like(ratios)
+    for c, (r, e) in enumerate(zip(ratio_rows, erpm_rows)):
+        ratios[c, :len(r)], ratios[c, len(r):] = r, r[-1]
+        erpm_per_mps[c, :len(e)], erpm_per_mps[c, len(e):] = e, e[-1]
+    gear_base = np.arange(n_cars) * ratios.shape[1]
+    ratios_flat, erpm_flat = ratios.ravel(), erpm_per_mps.ravel()
+    lut_flat, lut_base = lut.ravel(), np.arange(n_cars) * lut.shape[1]
+
+    # Per-car loop invariants (see _simulate_kernel)
+    traction_force_max = mu * mass * G * drive_factor
+    rolling_force = rolling_resistance * mass * G
+    aero_k = 0.5 * RHO_AIR * CdA
+    inv_mass = 1.0 / mass
+    inv_r = 1.0 / np.maximum(wheel_radius, 0.2)
+    torque_gain = final_drive * eng_eff * dl_eff
+    last_gear = n_gears - 1
+
+    # Row c holds car c's time series; rows are sliced contiguously on return.
+    n_max = int(MAX_SIM_TIME_S / dt) + 3
+    times = np.empty(n_max, dtype=SERIES_DTYPE)
+    distances = np.empty((n_cars, n_max), dtype=SERIES_DTYPE)
+    speeds = np.empty((n_cars, n_max), dtype=SERIES_DTYPE)
+    accels = np.empty((n_cars, n_max), dtype=SERIES_DTYPE)
+    gears = np.empty((n_cars, n_max), dtype=np.int64)
+    rpms = np.empty((n_cars, n_max), dtype=SERIES_DTYPE)
+    wheel_torques = np.empty((n_cars, n_max), dtype=SERIES_DTYPE)
+
+    # Finishing sample and float64 summary values, latched on the step
+    # each car crosses the line (-1 while still racing).
+    last = np.full(n_cars, -1, dtype=np.int64)
+    elapsed_time = np.empty(n_cars)
+    trap_speed = np.empty(n_cars)
+    final_shift_count = np.empty(n_cars, dtype=np.int64)
+
+    gear_index = np.zeros(n_cars, dtype=np.int64)
+    in_shift = np.zeros(n_cars, dtype=bool)
+    shift_timer_s = np.zeros(n_cars)
+    shift_count = np.zeros(n_cars, dtype=np.int64)
+    rpm = np.zeros(n_cars)
+
+    t = 0.0
+    x = np.zeros(n_cars)
+    v = np.zeros(n_cars)
+    i = 0
+    times[0] = 0.0
+    distances[:, 0] = speeds[:, 0] = accels[:, 0] = 0.0
+    rpms[:, 0] = wheel_torques[:, 0] = 0.0
+    gears[:, 0] = 1
+
+    # Cars that have crossed the line keep being integrated (harmlessly)
+    # until the slowest one finishes; each series is cut at its own
+    # finishing sample afterwards.
+    while x.min() < distance_target and t <= MAX_SIM_TIME_S:
+        # Manual shift window: count down, engage the next gear when done.
+        # Timers of cars not shifting run negative and are reset on upshift.
+        shifting = in_shift
+        shift_timer_s = shift_timer_s - dt
+        engaged = shifting & (shift_timer_s <= 0.0)
+        gear_index = gear_index + engaged
+        in_shift = shifting ^ engaged
+
+        driving = ~shifting
+        gear_flat = gear_base + gear_index
+        ratio = ratios_flat[gear_flat]
+        floor_rpm = np.where(v < 1.5, launch_rpm, idle_rpm)
+        raw_rpm = np.minimum(np.maximum(v * erpm_flat[gear_flat], floor_rpm), redline_rpm)
+        rpm = np.where(driving, raw_rpm, rpm)
+        k = rpm * scale
+        j = k.astype(np.int64) + lut_base
+        lo = lut_flat[j]
+        torque = lo + (k - (j - lut_base)) * (lut_flat[j + 1] - lo)
+        wheel_torque = torque * ratio * torque_gain * driving
+
+        upshift = driving & (gear_index < last_gear) & (rpm >= shift_rpm)
+        if upshift.any():
+            manual_up = upshift & is_manual
+            shift_count = shift_count + upshift
+            in_shift = in_shift | manual_up
+            shift_timer_s = np.where(manual_up, shift_time_s, shift_timer_s)
+            gear_index = gear_index + (upshift ^ manual_up)
+
+        usable_force = np.minimum(wheel_torque * inv_r, traction_force_max)
+        a = (usable_force - aero_k * v * v - rolling_force) * inv_mass
+
+        v = np.maximum(0.0, v + a * dt)
         x = x + v * dt
         t = t + dt
 
-        times.append(t)
-        distances.append(x)
-        speeds.append(v)
-        accels.append(a)
-        gears.append(state["gear_index"] + 1)
-        engine_rpms.append(state["engine_rpm"])
-        motor_rpms.append(state["motor_rpm"])
-        wheel_torques.append(wheel_torque)
-
-    return {
-        "time":         np.array(times),
-        "distance":     np.array(distances),
-        "speed":        np.array(speeds),
-        "accel":        np.array(accels),
-        "gear":         np.array(gears),
-        "engine_rpm":   np.array(engine_rpms),
-        "motor_rpm":    np.array(motor_rpms),
-        "wheel_torque": np.array(wheel_torques),
-        "elapsed_time": t,
-        "trap_speed":   v,
-        "shift_count":  state["shift_count"],
-    }
+        i += 1
+        times[i] = t
+        distances[:, i] = x
+        speeds[:, i] = v
+        accels[:, i] = a
+        gears[:, i] = gear_index + 1
+        rpms[:, i] = rpm
+        wheel_torques[:, i] = wheel_torque
+
+        finished = (last < 0) & (x >= distance_target)
+        if finished.any():
+            last[finished] = i
+            elapsed_time[finished] = t
+            trap_speed[finished] = v[finished]
+            final_shift_count[finished] = shift_count[finished]
+
+    # Cars that timed out end on the last sample.
+    timed_out = last < 0
+    last[timed_out] = i
+    elapsed_time[timed_out] = t
+    trap_speed[timed_out] = v[timed_out]
+    final_shift_count[timed_out] = shift_count[timed_out]
+
+    results = []
+    for c in range(n_cars):
+        n = last[c] + 1
+        zeros = np.zeros(n, dtype=SERIES_DTYPE)
+        results.append({
+            "time":         times[:n].copy(),
+            "distance":     distances[c, :n],
+            "speed":        speeds[c, :n],
+            "accel":        accels[c, :n],
+            "gear":         gears[c, :n],
+            "engine_rpm":   rpms[c, :n] if is_ice[c] else zeros,
+            "motor_rpm":    zeros if is_ice[c] else rpms[c, :n],
+            "wheel_torque": wheel_torques[c, :n],
+            "elapsed_time": float(elapsed_time[c]),
+            "trap_speed":   float(trap_speed[c]),
+            "shift_count":  int(final_shift_count[c]),
+        })
+    return results
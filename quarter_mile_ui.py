@@ -9,17 +9,31 @@ Compatibility: standard CPython, JupyterLab, JupyterLite / Pyodide (WASM).
 Requires ipywidgets and matplotlib in addition to numpy.
 """
 
-import copy
-
 import numpy as np
 import matplotlib.pyplot as plt
 import ipywidgets as widgets
 
-from quarter_mile_sim import interp_curve, QUARTER_MILE_M
+from quarter_mile_sim import QUARTER_MILE_M
 
 _TIRE_COMPOUNDS = ["all_season", "summer", "track", "drag_radial"]
 
 
+def _clone_spec(spec: dict) -> dict:
+    """
+    Copy a car preset just deep enough for ``get_spec`` to edit it.
+
+    Only the dicts on the path to the form-controlled fields (vehicle mass,
+    tyre, ICE gearbox) are copied; everything else – notably the torque
+    curves – is shared with the preset, which is never mutated.
+    """
+    out = {**spec}
+    out["vehicle"] = {**spec["vehicle"], "tire": {**spec["vehicle"]["tire"]}}
+    out["powertrain"] = {**spec["powertrain"]}
+    if "gearbox" in spec["powertrain"]:
+        out["powertrain"]["gearbox"] = {**spec["powertrain"]["gearbox"]}
+    return out
+
+
 # ── Form builder ──────────────────────────────────────────────────────────────
 
 def make_car_form(slot_label: str, default_key: str, car_database: dict):
@@ -98,7 +112,7 @@ def make_car_form(slot_label: str, default_key: str, car_database: dict):
 
     def get_spec():
         key = preset_dd.value
-        spec = copy.deepcopy(car_database[key])
+        spec = _clone_spec(car_database[key])
         spec["vehicle"]["mass"] = mass_txt.value
         spec["vehicle"]["tire"]["compound"] = cmpd_dd.value
         spec["vehicle"]["tire"]["width_mm"] = tirw_sl.value
@@ -133,7 +147,12 @@ def plot_accel_torque_vs_speed(cars: dict, results: dict) -> None:
     ax2.tick_params(axis="y", labelcolor=c2)
     for name, r in results.items():
         spd = r["speed"] * 3.6
-        order = np.argsort(spd)
+        # Speed only drops during a manual shift window, so most runs are
+        # already sorted and the slice keeps the series as views.
+        if np.all(spd[1:] >= spd[:-1]):
+            order = slice(None)
+        else:
+            order = np.argsort(spd, kind="stable")
         ax1.plot(spd[order], r["accel"][order], label=name, linewidth=2)
         ax2.plot(
             spd[order], r["wheel_torque"][order],
@@ -152,11 +171,12 @@ def plot_power_curves(cars: dict) -> None:
     fig, ax = plt.subplots(figsize=(10, 4))
     for name, car in cars.items():
         if car["powertrain_type"] == "ICE":
-            rpm_r = np.linspace(0, car["ice"]["redline_rpm"], 150)
-            tq = np.array([interp_curve(car["ice"]["torque_curve_rpm_nm"], r) for r in rpm_r])
+            block, max_rpm = car["ice"], car["ice"]["redline_rpm"]
         else:
-            rpm_r = np.linspace(0, car["motor"]["max_rpm"], 150)
-            tq = np.array([interp_curve(car["motor"]["torque_curve_rpm_nm"], r) for r in rpm_r])
+            block, max_rpm = car["motor"], car["motor"]["max_rpm"]
+        rpm_r = np.linspace(0, max_rpm, 150)
+        # One vectorised lookup over the breakpoint arrays cached by make_car.
+        tq = np.interp(rpm_r, block["_tc_x"], block["_tc_y"])
         ax.plot(rpm_r, tq * rpm_r / 7745, label=name, linewidth=2)
     ax.set_xlabel("RPM")
     ax.set_ylabel("Power (HP)")